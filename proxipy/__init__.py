@@ -3,13 +3,13 @@
 '''
 proxipy is the package that could help you get proxy in the easiest way:
 
-    >>> from proxipy import proxipy
+    >>> from proxipy import get_proxy
     >>> import requests
-    >>> prox = proxipy()
+    >>> prox = get_proxy()
     >>> prox
     {'http': ..., 'https': ...}
     >>> req = requests.get('http://httpbin.org/get',
-    ...                    proxies=proxipy(country='US', port=8080))
+    ...                    proxies=get_proxy(country='US', port=8080))
     >>> req
     <Response [...]>
 
@@ -17,7 +17,7 @@ proxipy is the package that could help you get proxy in the easiest way:
 
 from .proxipy import proxipy, WrongConnType, ReachedLimit, WrongCountryCode
 from .proxipy import WrongPort, ServiceUnavailable, TemporaryBlocked
-from .proxipy import NoProxyFound
+from .proxipy import NoProxyFound, WrongFormat, close, fetch_many, get_proxy
 
 from .__version__ import __title__, __description__, __url__, __version__
 from .__version__ import __author__, __license__, __copyright__
@@ -2,30 +2,197 @@
 
 import requests
 import logging
+import random
 import re
+import threading
+import time
 
-from functools import wraps
-from typing import Callable, Union
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from typing import Callable, Tuple, Union
+from urllib3.util.retry import Retry
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is optional
+    import json
 
-def return_dict(func: Callable) -> Callable:
+    def _json_loads(source: bytes):
+        return json.loads(source.decode('utf-8'))
 
-    @wraps(func)
-    def wrapper(*args, **kwargs) -> Union[dict, tuple]:
-        proxies = func(*args, **kwargs).get_proxies()
 
-        if kwargs.get('limit', 1) > 1:
-            proxies_tuple = ()
-            for prox in proxies:
-                proxies_tuple += (dict(http=prox, https=prox),)
-            return proxies_tuple
+logger = logging.getLogger(__name__)
+logger.propagate = False  # Fixes double output
+logger.setLevel(logging.DEBUG)
+
+if not logger.handlers:
+    _formatter = logging.Formatter(fmt='%(asctime)s - %(levelname)s:'
+                                       '%(funcName)s > %(message)s',
+                                   datefmt='%d/%m %I:%M:%S')
+
+    _handler = logging.StreamHandler()
+    _handler.setLevel(logging.INFO)
+    _handler.setFormatter(_formatter)
+
+    logger.addHandler(_handler)
+
+_COUNTRY_RE = re.compile(r'[A-Za-z]{2}')
+
+# Longest pause (in seconds) taken for ``Retry-After`` header of the service
+_RETRY_AFTER_MAX = 10
+
+
+class _CappedRetry(Retry):
+    '''Same as :class:`urllib3.util.retry.Retry`, but doesn't wait for ``Retry-After`` longer than :data:`_RETRY_AFTER_MAX`.'''
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+
+        if retry_after is not None:
+            return min(retry_after, _RETRY_AFTER_MAX)
+
+        return retry_after
+
+
+# Shared session, so the connection to proxy service is kept alive between calls.
+# Connection errors and 429/5xx responses are retried by urllib3 itself.
+_retry = _CappedRetry(total=3, backoff_factor=1.0,
+                      status_forcelist=(429, 500, 502, 503, 504),
+                      respect_retry_after_header=True)
+_session = requests.Session()
+_adapter = HTTPAdapter(max_retries=_retry, pool_connections=4, pool_maxsize=20)
+_session.mount('http://', _adapter)
+_session.mount('https://', _adapter)
+
+
+# Circuit breaker: after this many failures in a row don't connect to proxy
+# service for a cooldown (in seconds), just raise ServiceUnavailable
+_BREAKER_THRESHOLD = 5
+_BREAKER_COOLDOWN = 60
+_breaker = {'fails': 0, 'opened_at': 0.0}
+_breaker_lock = threading.Lock()
+
+# Responses cached with ``cache_ttl`` (least recently used are dropped first):
+# params -> (time got, proxies)
+_CACHE_MAXSIZE = 64
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def close() -> None:
+    '''Close connections to proxy service kept by shared session.'''
+
+    _session.close()
+
+
+def _retry_with_backoff(func: Callable, retriable_excs: tuple=None,
+                        max_retries: int=3, base: float=1.0,
+                        cap: float=30.0):
+    '''Call ``func`` retrying on ``retriable_excs`` with exponential backoff and full jitter.
+
+       Any other exception (like :class:`NoProxyFound`) is raised immediately.
+       Connection errors are not retried here: session adapter already does it.
+    '''
+
+    if retriable_excs is None:
+        retriable_excs = (TemporaryBlocked,)
+
+    for attempt in range(max_retries):
+        try:
+            return func()
+        except retriable_excs:
+            if attempt == max_retries - 1:
+                raise
+
+            time.sleep(random.uniform(0, min(cap, base * 2 ** attempt)))
+
+
+def _fetch(params_items: tuple, format_: str='txt') -> Tuple[str, ...]:
+    '''Make request to proxy service with given params and parse proxies from response.'''
+
+    logger.debug('Making request to proxy service with params %s',
+                 params_items)
+
+    def _do_request() -> bytes:
+        try:
+            source = _session.get('http://pubproxy.com/api/proxy',
+                                  timeout=(5, 6),
+                                  params=params_items).content
+
+        except Exception as e:
+            raise ServiceUnavailable('Cannot connect to service.')
+
+        if b'#premium' in source:
+            raise TemporaryBlocked('Too many requests per second.')
+
+        return source
+
+    with _breaker_lock:
+        if (_breaker['fails'] >= _BREAKER_THRESHOLD and
+                time.monotonic() - _breaker['opened_at'] < _BREAKER_COOLDOWN):
+            raise ServiceUnavailable('Service failed too many times in a row. '
+                                     'Please, try again later.')
+
+    try:
+        source = _retry_with_backoff(_do_request)
+
+    except ServiceUnavailable:
+        with _breaker_lock:
+            _breaker['fails'] += 1
+            _breaker['opened_at'] = time.monotonic()
+        raise
+
+    with _breaker_lock:
+        _breaker['fails'] = 0
+
+    if source == b'No proxy':
+        raise NoProxyFound('There is no proxy to your filters. '
+                           'Please, try to change it.')
+
+    # Build tuple in one pass: `+=` on tuple in a loop copies it every time (O(n^2))
+    try:
+        if format_ == 'json':
+            proxies = tuple('http://' + proxy['ipPort']
+                            for proxy in _json_loads(source).get('data') or ())
         else:
-            return dict(http=proxies[0], https=proxies[0])
+            proxies = tuple('http://' + proxy.decode('ascii')
+                            for proxy in source.split())
+
+    except (ValueError, AttributeError, KeyError, TypeError):
+        raise ServiceUnavailable('Cannot parse service response.')
+
+    if not proxies:
+        raise NoProxyFound('There is no proxy to your filters. '
+                           'Please, try to change it.')
+
+    return proxies
+
+
+def _fetch_cached(params_items: tuple, format_: str,
+                  ttl: int) -> Tuple[str, ...]:
+    '''Same as :func:`_fetch`, but results are reused for ``ttl`` seconds after they were got.'''
 
-    return wrapper
+    # ``format`` is one of params already, so params alone are the key
+    with _cache_lock:
+        cached = _cache.get(params_items)
+
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            _cache.move_to_end(params_items)
+            return cached[1]
+
+    proxies = _fetch(params_items, format_)
+
+    with _cache_lock:
+        _cache[params_items] = (time.monotonic(), proxies)
+        _cache.move_to_end(params_items)
+
+        while len(_cache) > _CACHE_MAXSIZE:
+            _cache.popitem(last=False)
+
+    return proxies
 
 
-@return_dict
 class proxipy:
     '''Need proxy? Catch it.
 
@@ -35,13 +202,15 @@ class proxipy:
        :param limit: Amount of proxies to return (no more than 20 proxies per request).
        :param country: String of countries *(2 char code - like 'US')* separated by commas.
        :param port: Apply given port.
+       :param cache_ttl: (in seconds) Reuse proxies got with the same params for up to given amount of time.
+       :param format_: Format of proxy service response: ``txt`` or ``json``.
        :param \*\*kwargs: Optional arguments that you don't really need.
-       :returns: ``dict`` if 1 proxy, ``tuple`` of proxies if more.
 
        :raises: :class:`WrongConnType`, if ``type_`` param is not "http" or "socks4" or "socks5".
        :raises: :class:`ReachedLimit`, if ``limit`` param less than 1 or more than 20.
        :raises: :class:`WrongCountryCode`, if ``country`` param is not 2 symbol code.
        :raises: :class:`WrongPort`, if ``port`` param < 1 or > 65535.
+       :raises: :class:`WrongFormat`, if ``format_`` param is not "txt" or "json".
 
        Usage:
 
@@ -49,51 +218,39 @@ class proxipy:
 
             >>> from proxipy import proxipy
             >>> import requests
-            >>> prox = proxipy()
-            >>> prox  # doctest: +ELLIPSIS
+            >>> prox = proxipy(country='US', port=8080)
+            >>> prox.get_proxies_dict()  # doctest: +ELLIPSIS
             {'http': ..., 'https': ...}
             >>> req = requests.get('http://httpbin.org/get',
-            ...                    proxies=proxipy(country='US', port=8080))
+            ...                    proxies=prox.get_proxies_dict())
             >>> req  # doctest: +ELLIPSIS
             <Response [...]>
 
     '''
 
     def __init__(self, type_: str='http', https: bool=True, last_check: int=60,
-                 limit: int=1, country: str=None, port: int=None, **kwargs):
-        self._logger = logging.getLogger(__name__)
-        self._logger.propagate = False  # Fixes double output
-        self._logger.setLevel(logging.DEBUG)
-
-        if not self._logger.handlers:
-            self.formatter = logging.Formatter(fmt='%(asctime)s - %(levelname)s:'
-                                                   '%(funcName)s > %(message)s',
-                                               datefmt='%d/%m %I:%M:%S')
-
-            self.handler = logging.StreamHandler()
-            self.handler.setLevel(logging.INFO)
-            self.handler.setFormatter(self.formatter)
-
-            self._logger.addHandler(self.handler)
-
+                 limit: int=1, country: str=None, port: int=None,
+                 cache_ttl: int=None, format_: str='txt', **kwargs):
         if type_ in ['http', 'socks4', 'socks5']:
             self.type_ = type_
         else:
             raise WrongConnType('Type should be "http" or "socks4" or'
                                 '"socks5".')
 
-        self.https = bool(https) if https else True
+        self.https = bool(https)
         self.last_check = int(last_check) if last_check else 60
 
-        if 1 <= int(limit) <= 20:
-            self.limit = int(limit)
-        else:
+        try:
+            limit = int(limit)
+        except (TypeError, ValueError):
             raise ReachedLimit('Cannot be less than 1 and more than 20.')
 
-        if country:
-            self.country_regex = re.compile(r'^([a-z]){2}$', re.I)
+        if not 1 <= limit <= 20:
+            raise ReachedLimit('Cannot be less than 1 and more than 20.')
+        self.limit = limit
 
-            if bool(self.country_regex.search(country)):
+        if country:
+            if _COUNTRY_RE.fullmatch(country):
                 self.country = country
             else:
                 raise WrongCountryCode('You have to use appropriate 2 symbol '
@@ -101,28 +258,28 @@ class proxipy:
         else:
             self.country = None
 
-        if port and 1 <= int(port) <= 65535:
-            self.port = int(port)
-        else:
-            if port is None:
-                self.port = None
-            else:
+        if port is not None:
+            try:
+                port = int(port)
+            except (TypeError, ValueError):
+                raise WrongPort('Port need to be >= 1 and <= 65535.')
+
+            if not 1 <= port <= 65535:
                 raise WrongPort('Port need to be >= 1 and <= 65535.')
+        self.port = port
+
+        self.cache_ttl = int(cache_ttl) if cache_ttl else None
+
+        if format_ in ['txt', 'json']:
+            self.format = format_
+        else:
+            raise WrongFormat('Format should be "txt" or "json".')
 
         # Additional arguments: you don't need it, actually
         self.post = kwargs.get('post', True)
         self.user_agent = kwargs.get('user_agent', True)
         self.cookies = kwargs.get('cookies', None)
         self.referrer = kwargs.get('referrer', None)
-        self.format = 'txt'
-
-    def get_proxies(self) -> Union[dict, tuple]:
-        '''Actually making request to proxy service. **NOT** an interface, use just :class:`proxipy.proxipy`.
-
-           :raises: :class:`ServiceUnavailable`, if can't connect to proxy service.
-           :raises: :class:`TemporaryBlocked`, if making more than 1 request per second.
-           :raises: :class:`NoProxyFound`, if there is no proxy to your filters.
-        '''
 
         self._params = dict(type=self.type_, https=self.https,
                             last_check=self.last_check, limit=self.limit,
@@ -130,37 +287,122 @@ class proxipy:
                             post=self.post, user_agent=self.user_agent,
                             cookies=self.cookies, referrer=self.referrer,
                             format=self.format)
+        self._params_items = tuple(sorted(self._params.items()))
 
-        self._logger.debug('Making request to proxy service with params %s',
-                           self._params)
+    def get_proxies(self) -> Tuple[str, ...]:
+        '''Actually making request to proxy service.
 
-        try:
-            self._source = requests.get('http://pubproxy.com/api/proxy',
-                                        timeout=(5, 6),
-                                        params=self._params).text
+           :returns: ``tuple`` of proxy urls.
 
-        except Exception as e:
-            raise ServiceUnavailable('Cannot connect to service.')
+           :raises: :class:`ServiceUnavailable`, if can't connect to proxy service, parse its response (or it failed too many times in a row recently).
+           :raises: :class:`TemporaryBlocked`, if making more than 1 request per second.
+           :raises: :class:`NoProxyFound`, if there is no proxy to your filters.
+        '''
 
-        if '#premium' in self._source:
-            raise TemporaryBlocked('Too many requests per second.')
+        if self.cache_ttl:
+            proxies = _fetch_cached(self._params_items, self.format,
+                                    self.cache_ttl)
+        else:
+            proxies = _fetch(self._params_items, self.format)
+
+        # Local variable, so concurrent calls (see fetch_many) don't mix results
+        self.proxies = proxies
+
+        if self.limit > 1:
+            logger.info('Got proxy %s', proxies)
+        else:
+            logger.info('Got proxy %s', proxies[0])
 
-        if self._source == 'No proxy':
-            raise NoProxyFound('There is no proxy to your filters. '
-                               'Please, try to change it.')
+        return proxies
 
-        self._to_proxies = self._source.split()
-        self.proxies = ()
+    def get_proxies_dict(self) -> Union[dict, tuple]:
+        '''Get proxies ready to be passed to requests module.
 
-        for proxy in self._to_proxies[::-1]:
-            self.proxies += ('http://{}'.format(self._to_proxies.pop()),)
+           :returns: ``dict`` if 1 proxy, ``tuple`` of ``dict``'s if more.
+
+           Raises same exceptions as :meth:`get_proxies`.
+        '''
+
+        proxies = self.get_proxies()
 
         if self.limit > 1:
-            self._logger.info('Got proxy %s', self.proxies)
+            return tuple({'http': prox, 'https': prox} for prox in proxies)
         else:
-            self._logger.info('Got proxy %s', self.proxies[0])
+            return {'http': proxies[0], 'https': proxies[0]}
+
 
-        return self.proxies
+def get_proxy(*args, **kwargs) -> Union[dict, tuple]:
+    '''Need proxy? Catch it. Shortcut for one request to proxy service.
+
+       Takes same arguments as :class:`proxipy.proxipy`. If you need proxies
+       many times, create :class:`proxipy.proxipy` once and call
+       :meth:`proxipy.proxipy.get_proxies_dict` instead.
+
+       :returns: ``dict`` if 1 proxy, ``tuple`` of proxies if more.
+
+       Usage:
+
+       .. doctest::
+
+            >>> from proxipy import get_proxy
+            >>> import requests
+            >>> prox = get_proxy()
+            >>> prox  # doctest: +ELLIPSIS
+            {'http': ..., 'https': ...}
+            >>> req = requests.get('http://httpbin.org/get',
+            ...                    proxies=get_proxy(country='US', port=8080))
+            >>> req  # doctest: +ELLIPSIS
+            <Response [...]>
+
+    '''
+
+    return proxipy(*args, **kwargs).get_proxies_dict()
+
+
+def fetch_many(n: int, max_workers: int=8, interval: float=1.0,
+               **kwargs) -> tuple:
+    '''Make ``n`` requests to proxy service concurrently.
+
+       Replaces ``for _ in range(n): get_proxy(...)`` loop. Proxy service
+       allows about 1 request per second, so requests are started no more
+       often than once per ``interval`` seconds, but don't wait for each
+       other to finish: it takes about ``n * interval`` seconds instead of
+       ``n`` round-trips plus pauses between them.
+
+       :param n: Amount of requests to make.
+       :param max_workers: Maximum amount of simultaneous requests.
+       :param interval: (in seconds) Minimal time between starts of requests.
+       :param \*\*kwargs: Arguments passed to :class:`proxipy.proxipy`.
+       :returns: ``tuple`` of ``n`` results of :meth:`proxipy.proxipy.get_proxies_dict`.
+                 If some request failed, its exception is placed instead of result.
+
+       Raises same exceptions as :class:`proxipy.proxipy` on wrong arguments.
+    '''
+
+    prox = proxipy(**kwargs)
+
+    lock = threading.Lock()
+    next_start = time.monotonic()
+
+    def _get_proxy_in_turn() -> Union[dict, tuple, Exception]:
+        nonlocal next_start
+
+        with lock:
+            delay = next_start - time.monotonic()
+            next_start = max(next_start, time.monotonic()) + interval
+
+        if delay > 0:
+            time.sleep(delay)
+
+        try:
+            return prox.get_proxies_dict()
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(_get_proxy_in_turn) for _ in range(n)]
+
+    return tuple(future.result() for future in futures)
 
 
 class WrongConnType(Exception):
@@ -179,8 +421,12 @@ class WrongPort(Exception):
     '''Raised when ``port`` param need to be >= 1 and <= 65535.'''
 
 
+class WrongFormat(Exception):
+    '''Raised when ``format_`` param is not "txt" or "json".'''
+
+
 class ServiceUnavailable(Exception):
-    '''Raised when cannot connect to proxy service.'''
+    '''Raised when cannot connect to proxy service or parse its response.'''
 
 
 class TemporaryBlocked(Exception):
@@ -18,6 +18,7 @@ TESTS_REQUIRE = ['pytest==3.7.1']
 # What packages are optional?
 EXTRAS = {
     # 'fancy feature': ['django'],
+    'orjson': ['orjson'],
 }
 
 # The rest you shouldn't have to touch too much :)
@@ -2,9 +2,13 @@
 
 import pytest
 import proxipy
+import importlib
+import threading
 import time
 import re
 
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from types import SimpleNamespace
 from typing import Callable, Union
 
 
@@ -12,7 +16,7 @@ from typing import Callable, Union
 def get_proxy() -> Callable:
 
     def wrapper(*args, **kwargs) -> Union[dict, tuple]:
-        prox = proxipy.proxipy(*args, **kwargs)
+        prox = proxipy.get_proxy(*args, **kwargs)
         time.sleep(1)
 
         return prox
@@ -38,3 +42,77 @@ def regex_proxy() -> Callable:
         return False
 
     return wrapper
+
+
+@pytest.fixture(scope='function')
+def proxipy_module():
+    # ``proxipy.proxipy`` is shadowed by the class, so get the module itself
+    return importlib.import_module('proxipy.proxipy')
+
+
+@pytest.fixture(scope='function', autouse=True)
+def reset_breaker(proxipy_module):
+    # Circuit breaker is process-wide: don't let one test open it for others
+    proxipy_module._breaker.update(fails=0, opened_at=0.0)
+    yield
+    proxipy_module._breaker.update(fails=0, opened_at=0.0)
+
+
+@pytest.fixture(scope='function', autouse=True)
+def clear_cache(proxipy_module):
+    proxipy_module._cache.clear()
+    yield
+    proxipy_module._cache.clear()
+
+
+@pytest.fixture(scope='function')
+def fake_get(monkeypatch, proxipy_module) -> Callable:
+    '''Replace ``get`` of shared session with a stub.
+
+       Every call returns next of ``fake.bodies`` (the last one is repeated);
+       exception instances are raised instead of returned.
+    '''
+
+    class FakeGet:
+        def __init__(self):
+            self.bodies = [b'1.2.3.4:8080']
+            self.calls = []
+            self._lock = threading.Lock()
+
+        def __call__(self, *args, **kwargs):
+            with self._lock:
+                body = self.bodies[min(len(self.calls), len(self.bodies) - 1)]
+                self.calls.append(time.monotonic())
+
+            if isinstance(body, Exception):
+                raise body
+
+            return SimpleNamespace(content=body)
+
+    fake = FakeGet()
+    monkeypatch.setattr(proxipy_module._session, 'get', fake)
+
+    return fake
+
+
+@pytest.fixture(scope='function')
+def local_server() -> str:
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header('Content-Length', '2')
+            self.end_headers()
+            self.wfile.write(b'ok')
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield 'http://127.0.0.1:{}/'.format(server.server_port)
+
+    server.shutdown()
+    server.server_close()
@@ -2,6 +2,10 @@
 
 import proxipy
 import pytest
+import requests
+import time
+
+from urllib3 import HTTPResponse
 
 
 def test_get_proxy_without_args(get_proxy, regex_proxy):
@@ -30,13 +34,247 @@ def test_get_proxy_with_limit(get_proxy, regex_proxy, limit):
         assert regex_proxy(prox_dict)
 
 
+def test_get_proxies_dict_reuse(regex_proxy):
+    prox = proxipy.proxipy(country='US', port=8080)
+
+    for _ in range(2):
+        assert regex_proxy(prox.get_proxies_dict(), 8080)
+        time.sleep(1)
+
+
+def test_get_proxy_with_cache(monkeypatch, fake_get):
+    now = [1000.0]
+    monkeypatch.setattr(time, 'monotonic', lambda: now[0])
+    fake_get.bodies = [b'1.2.3.4:8080', b'5.6.7.8:8080']
+
+    prox_dict = proxipy.get_proxy(cache_ttl=60, port=8080)
+    assert prox_dict['http'] == 'http://1.2.3.4:8080'
+
+    now[0] += 59
+    assert proxipy.get_proxy(cache_ttl=60, port=8080) == prox_dict
+    assert proxipy.get_proxy(cache_ttl=60, port=80) != prox_dict
+    assert len(fake_get.calls) == 2
+
+    now[0] += 1
+    assert proxipy.get_proxy(cache_ttl=60, port=8080) != prox_dict
+    assert len(fake_get.calls) == 3
+
+
+@pytest.mark.parametrize('limit', [1, 2])
+def test_get_proxy_with_json_format(get_proxy, regex_proxy, limit):
+    prox = get_proxy(format_='json', limit=limit)
+    prox_list = prox if limit > 1 else (prox,)
+    assert len(prox_list) == limit
+
+    for prox_dict in prox_list:
+        assert regex_proxy(prox_dict)
+
+
+def test_cache_evicts_least_recently_used(monkeypatch, proxipy_module,
+                                          fake_get):
+    monkeypatch.setattr(proxipy_module, '_CACHE_MAXSIZE', 2)
+
+    proxipy.get_proxy(cache_ttl=60, port=1)
+    proxipy.get_proxy(cache_ttl=60, port=2)
+    proxipy.get_proxy(cache_ttl=60, port=1)  # hit: port=1 is used recently
+    proxipy.get_proxy(cache_ttl=60, port=3)  # drops port=2
+    assert len(fake_get.calls) == 3
+
+    proxipy.get_proxy(cache_ttl=60, port=1)
+    assert len(fake_get.calls) == 3
+
+    proxipy.get_proxy(cache_ttl=60, port=2)
+    assert len(fake_get.calls) == 4
+
+
+def test_close_keeps_session_usable(proxipy_module, local_server):
+    assert proxipy_module._session.get(local_server).content == b'ok'
+
+    proxipy.close()
+    proxipy.close()
+
+    assert proxipy_module._session.get(local_server).content == b'ok'
+
+
+def test_retry_temporary_blocked(monkeypatch, proxipy_module, fake_get):
+    sleeps = []
+    monkeypatch.setattr(time, 'sleep', sleeps.append)
+
+    fake_get.bodies = [b'#premium']
+    with pytest.raises(proxipy.TemporaryBlocked):
+        proxipy.get_proxy()
+
+    assert len(fake_get.calls) == 3
+    assert len(sleeps) == 2
+    for attempt, delay in enumerate(sleeps):
+        assert 0 <= delay <= min(30.0, 1.0 * 2 ** attempt)
+
+    fake_get.calls.clear()
+    fake_get.bodies = [b'#premium', b'1.2.3.4:8080']
+    assert proxipy.get_proxy() == {'http': 'http://1.2.3.4:8080',
+                                   'https': 'http://1.2.3.4:8080'}
+    assert len(fake_get.calls) == 2
+
+
+def test_retry_backoff_is_capped(monkeypatch, proxipy_module):
+    sleeps = []
+    monkeypatch.setattr(time, 'sleep', sleeps.append)
+    monkeypatch.setattr(proxipy_module.random, 'uniform', lambda a, b: b)
+
+    def blocked():
+        raise proxipy.TemporaryBlocked
+
+    with pytest.raises(proxipy.TemporaryBlocked):
+        proxipy_module._retry_with_backoff(blocked, max_retries=4,
+                                           base=1.0, cap=1.5)
+
+    assert sleeps == [1.0, 1.5, 1.5]
+
+
+def test_retry_skips_no_proxy_found(monkeypatch, proxipy_module, fake_get):
+    sleeps = []
+    monkeypatch.setattr(time, 'sleep', sleeps.append)
+
+    fake_get.bodies = [b'No proxy']
+    with pytest.raises(proxipy.NoProxyFound):
+        proxipy.get_proxy()
+
+    calls = []
+
+    def no_proxy():
+        calls.append(1)
+        raise proxipy.NoProxyFound
+
+    with pytest.raises(proxipy.NoProxyFound):
+        proxipy_module._retry_with_backoff(no_proxy)
+
+    assert len(fake_get.calls) == 1
+    assert len(calls) == 1
+    assert sleeps == []
+
+
+def test_fetch_many_spaces_requests(fake_get):
+    results = proxipy.fetch_many(4, interval=0.1)
+
+    assert results == ({'http': 'http://1.2.3.4:8080',
+                        'https': 'http://1.2.3.4:8080'},) * 4
+
+    starts = sorted(fake_get.calls)
+    for prev, cur in zip(starts, starts[1:]):
+        assert cur - prev >= 0.09
+
+
+@pytest.mark.parametrize('kwargs,error', [(dict(port=99999), proxipy.WrongPort),
+                                          (dict(limit=0), proxipy.ReachedLimit)])
+def test_fetch_many_wrong_args(fake_get, kwargs, error):
+    start = time.monotonic()
+
+    with pytest.raises(error):
+        proxipy.fetch_many(10, **kwargs)
+
+    assert time.monotonic() - start < 0.5
+    assert fake_get.calls == []
+
+
+def test_fetch_many_collects_errors(fake_get):
+    fake_get.bodies = [b'1.2.3.4:8080', b'No proxy', b'5.6.7.8:80']
+    results = proxipy.fetch_many(3, max_workers=1, interval=0)
+
+    assert results[0] == {'http': 'http://1.2.3.4:8080',
+                          'https': 'http://1.2.3.4:8080'}
+    assert isinstance(results[1], proxipy.NoProxyFound)
+    assert results[2] == {'http': 'http://5.6.7.8:80',
+                          'https': 'http://5.6.7.8:80'}
+
+
+def test_session_adapter_retries(proxipy_module):
+    retry = proxipy_module._session.get_adapter('http://pubproxy.com').max_retries
+
+    assert retry.total == 3
+    assert set(retry.status_forcelist) == {429, 500, 502, 503, 504}
+    assert retry.respect_retry_after_header
+
+
+@pytest.mark.parametrize('header,expected', [('3600', 10), ('2', 2)])
+def test_session_adapter_caps_retry_after(proxipy_module, header, expected):
+    retry = proxipy_module._session.get_adapter('http://pubproxy.com').max_retries
+    response = HTTPResponse(status=429, headers={'Retry-After': header})
+
+    assert retry.get_retry_after(response) == expected
+    assert retry.new(total=2).get_retry_after(response) == expected
+
+
+@pytest.mark.parametrize('body', [b'<html>Bad Gateway</html>', b'[1, 2]',
+                                  b'{"data": [{"ip": "1.2.3.4"}]}',
+                                  b'{"data": [1]}', b'{"data": "oops"}'])
+def test_error_malformed_json(fake_get, body):
+    fake_get.bodies = [body]
+
+    with pytest.raises(proxipy.ServiceUnavailable):
+        proxipy.get_proxy(format_='json')
+
+
+def test_error_malformed_txt(fake_get):
+    fake_get.bodies = ['Über'.encode()]
+
+    with pytest.raises(proxipy.ServiceUnavailable):
+        proxipy.get_proxy()
+
+
+@pytest.mark.parametrize('body', [b'', b' \n'])
+def test_error_empty_txt(fake_get, body):
+    fake_get.bodies = [body]
+
+    with pytest.raises(proxipy.NoProxyFound):
+        proxipy.get_proxy()
+
+
+def test_get_proxy_json_stubbed(fake_get):
+    fake_get.bodies = [b'{"data": [{"ipPort": "1.2.3.4:8080"}], "count": 1}']
+
+    assert proxipy.get_proxy(format_='json') == {'http': 'http://1.2.3.4:8080',
+                                                 'https': 'http://1.2.3.4:8080'}
+
+
+def test_circuit_breaker(monkeypatch, proxipy_module, fake_get):
+    now = [1000.0]
+    monkeypatch.setattr(time, 'monotonic', lambda: now[0])
+    fake_get.bodies = [requests.ConnectionError()]
+
+    for _ in range(proxipy_module._BREAKER_THRESHOLD):
+        with pytest.raises(proxipy.ServiceUnavailable):
+            proxipy.get_proxy()
+    assert len(fake_get.calls) == proxipy_module._BREAKER_THRESHOLD
+
+    # Open: fails fast without connecting
+    with pytest.raises(proxipy.ServiceUnavailable):
+        proxipy.get_proxy()
+    assert len(fake_get.calls) == proxipy_module._BREAKER_THRESHOLD
+
+    # Half-open after cooldown: one more attempt, which fails and re-opens it
+    now[0] += proxipy_module._BREAKER_COOLDOWN
+    with pytest.raises(proxipy.ServiceUnavailable):
+        proxipy.get_proxy()
+    assert len(fake_get.calls) == proxipy_module._BREAKER_THRESHOLD + 1
+
+    with pytest.raises(proxipy.ServiceUnavailable):
+        proxipy.get_proxy()
+    assert len(fake_get.calls) == proxipy_module._BREAKER_THRESHOLD + 1
+
+    # Success after cooldown closes it
+    now[0] += proxipy_module._BREAKER_COOLDOWN
+    fake_get.bodies.append(b'1.2.3.4:8080')
+    assert proxipy.get_proxy()['http'] == 'http://1.2.3.4:8080'
+    assert proxipy_module._breaker['fails'] == 0
+
+
 @pytest.mark.parametrize('type_', ['https', 'socks0'])
 def test_error_wrong_conn_name(get_proxy, type_):
     with pytest.raises(proxipy.WrongConnType):
         get_proxy(type_=type_)
 
 
-@pytest.mark.parametrize('limit', [-1, 0, 21])
+@pytest.mark.parametrize('limit', [-1, 0, 21, '', None])
 def test_error_reached_limit(get_proxy, limit):
     with pytest.raises(proxipy.ReachedLimit):
         get_proxy(limit=limit)
@@ -48,12 +286,18 @@ def test_error_wrong_country_code(get_proxy, country):
         get_proxy(country=country)
 
 
-@pytest.mark.parametrize('port', [-1, 0, 65536])
+@pytest.mark.parametrize('port', [-1, 0, 65536, '', 'http'])
 def test_error_wrong_port(get_proxy, port):
     with pytest.raises(proxipy.WrongPort):
         get_proxy(port=port)
 
 
+@pytest.mark.parametrize('format_', ['xml', 'TXT'])
+def test_error_wrong_format(get_proxy, format_):
+    with pytest.raises(proxipy.WrongFormat):
+        get_proxy(format_=format_)
+
+
 @pytest.mark.parametrize('kwargs', [dict(country='UK'),
                                     dict(referrer=False, cookies=True,
                                          user_agent=False)])